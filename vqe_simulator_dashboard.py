@@ -1,63 +1,277 @@
 import tkinter as tk
 from tkinter import ttk, Canvas, Frame
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import font as tkFont
+import functools
+import matplotlib
+matplotlib.use('Agg')  # Charts are rendered off-screen and shown as a Tk photo image
+from matplotlib import style as mplstyle
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
+from PIL import Image, ImageTk
 import matplotlib.patches as patches
+from collections import deque
+import queue
 import sys
 import os
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+logger = logging.getLogger(__name__)
+
+# Clean modern color scheme, defined once so every widget and config call shares the same strings
+COLORS = {
+    'bg': '#FFFFFF',
+    'fg': '#2C3E50',
+    'primary': '#3498DB',
+    'secondary': '#ECF0F1',
+    'accent': '#E74C3C',
+    'text': '#34495E',
+    'light_gray': '#F8F9FA',
+    'border': '#BDC3C7'
+}
 
 class PixelFont:
     """Clean font helper"""
     @staticmethod
-    def get_clean_font(size=12, weight="normal"):
-        # Use clean, modern fonts
-        return ("Segoe UI", size, weight)
+    @functools.lru_cache(maxsize=32)
+    def font(size=12, weight="normal"):
+        """Shared named Tk font, created once per size and weight"""
+        return tkFont.Font(family="Segoe UI", size=size, weight=weight)
+
+class BlitManager:
+    """Redraw a fixed set of animated artists over a cached figure background"""
+    def __init__(self, canvas, animated_artists=()):
+        self.canvas = canvas
+        self.background = None
+        self.artists = []
+        for artist in animated_artists:
+            self.add_artist(artist)
+        # Re-capture the static background after every full draw (incl. resizes)
+        self.draw_cid = canvas.mpl_connect('draw_event', self.on_draw)
+        
+    def on_draw(self, event):
+        """Cache the freshly drawn background and paint the animated artists on it"""
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_animated()
+        
+    def add_artist(self, artist):
+        artist.set_animated(True)
+        self.artists.append(artist)
+        
+    def draw_animated(self):
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+            
+    def update(self):
+        """Restore the background and redraw only the animated artists"""
+        if self.background is None:
+            self.canvas.draw()  # Fires on_draw, which captures the background
+        else:
+            self.canvas.restore_region(self.background)
+            self.draw_animated()
+            self.canvas.blit(self.canvas.figure.bbox)
+
+class ChartPanel:
+    """Axes and animated artists for one method's chart"""
+    def __init__(self, title, ax, line, scatter, result_text, status_text, scatter_offsets):
+        self.title = title
+        self.ax = ax
+        self.line = line
+        self.scatter = scatter
+        self.result_text = result_text
+        self.status_text = status_text  # Shows the convergence mark
+        self.frozen = False  # Converged and already drawn in that state
+        self.refreshed_at = 0  # Iteration of the last data refresh
+        self.pending_status = None  # Convergence mark text to apply on the next update
+        self.reset_pending = False  # Restart to apply on the next update
+        self.scatter_offsets = scatter_offsets  # Reused (N, 2) buffer for every 5th point
+        self.ylim = None  # Set from the first data point, refit when the data shrinks well inside it
+
+class MonoMinMax:
+    """Sliding-window min/max in O(1) amortized time using two monotonic deques"""
+    def __init__(self, window):
+        self.window = window
+        self.clear()
+        
+    def clear(self):
+        self.count = 0
+        self.min_deque = deque()  # (value, index), values increasing
+        self.max_deque = deque()  # (value, index), values decreasing
+        
+    def append(self, value):
+        index = self.count
+        self.count += 1
+        
+        while self.min_deque and self.min_deque[-1][0] >= value:
+            self.min_deque.pop()
+        self.min_deque.append((value, index))
+        while self.max_deque and self.max_deque[-1][0] <= value:
+            self.max_deque.pop()
+        self.max_deque.append((value, index))
+        
+        # Drop extremes that have slid out of the window
+        if self.min_deque[0][1] <= index - self.window:
+            self.min_deque.popleft()
+        if self.max_deque[0][1] <= index - self.window:
+            self.max_deque.popleft()
+            
+    def is_full(self):
+        return self.count >= self.window
+        
+    def range(self):
+        return self.max_deque[0][0] - self.min_deque[0][0]
 
 class VQEDashboard:
     def __init__(self, root):
         self.root = root
+        self.root.withdraw()  # Stay unmapped while the widgets are built - one layout pass at the end
         self.root.title("VQE Quantum Simulator")
         self.root.geometry("1400x900")
-        self.root.configure(bg='#FFFFFF')
+        self.root.configure(bg=COLORS['bg'])
         
         # Set minimum size
         self.root.minsize(1200, 800)
         
         # Clean modern color scheme
-        self.colors = {
-            'bg': '#FFFFFF',
-            'fg': '#2C3E50',
-            'primary': '#3498DB',
-            'secondary': '#ECF0F1',
-            'accent': '#E74C3C',
-            'text': '#34495E',
-            'light_gray': '#F8F9FA',
-            'border': '#BDC3C7'
-        }
-        
-        # Configure matplotlib for clean white theme
-        plt.style.use('default')
-        
-        # Data storage for real-time updates
+        self.colors = COLORS
+        
+        # Configure matplotlib for clean white theme, so the charts need no per-axes styling
+        mplstyle.use('default')
+        matplotlib.rcParams.update({
+            'axes.facecolor': 'white',
+            'axes.edgecolor': self.colors['border'],
+            'axes.spines.top': False,
+            'axes.spines.right': False,
+            'axes.grid': True,
+            'axes.titlesize': 12,
+            'axes.titleweight': 'bold',
+            'axes.titlecolor': self.colors['text'],
+            'axes.labelsize': 10,
+            'axes.labelcolor': self.colors['text'],
+            'grid.alpha': 0.3,
+            'grid.color': 'gray',
+            'grid.linestyle': '-',
+            'grid.linewidth': 0.5,
+            'xtick.color': self.colors['text'],
+            'ytick.color': self.colors['text'],
+            'xtick.labelsize': 9,
+            'ytick.labelsize': 9,
+            'legend.fontsize': 8,
+            'legend.loc': 'upper right',
+            # Cheaper line rendering: coarser path simplification and chunked Agg paths.
+            # autolayout and simplify are matplotlib's defaults, pinned here because the
+            # layout is computed once by tight_layout and the threshold needs simplify on.
+            'figure.autolayout': False,
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000
+        })
+        
+        # Data storage for real-time updates (fixed-size ring buffers)
+        self.history_size = 50  # Number of points kept per method
         self.data_storage = {
-            'normal_vqe': {'iterations': [], 'energy': []},
-            'vqe_uccsd_hybrid': {'iterations': [], 'energy': []},
-            'vqe_uccsd_hybrid_zne': {'iterations': [], 'energy': []}
+            'normal_vqe': self.create_history(),
+            'vqe_uccsd_hybrid': self.create_history(),
+            'vqe_uccsd_hybrid_zne': self.create_history()
         }
         
         # Current iteration counter
         self.current_iteration = 0
         
+        # Synthetic energy model, one entry per method in data_storage order:
+        # Normal VQE - slower convergence, more noise
+        # VQE + UCCSD + Hybrid - fast convergence, medium noise
+        # VQE + UCCSD + Hybrid + ZNE - best performance with all optimizations
+        self.rng = np.random.default_rng()
+        self._noise_buf = self.rng.random((1024, 3))  # One row of noise consumed per iteration
+        self._noise_idx = 0
+        self._base = np.array([-0.8, -1.0, -1.1])
+        self._amp = np.array([0.4, 0.4, 0.5])
+        self._tau = np.array([20.0, 10.0, 8.0])
+        self._noise = np.array([0.08, 0.03, 0.02])
+        self._held_noise = np.array([0.001, 0.001, 0.0005])  # Fluctuation once converged
+        self._held = np.full(3, np.nan)  # Energy each method converged at (NaN until then)
+        # exp(-iteration / tau) for every method, precomputed per integer iteration.
+        # Past the end of the table the decay is effectively zero (< 1e-200).
+        self._exp_table = np.exp(-np.arange(10_000)[:, None] / self._tau[None, :])
+        
         # Simulation control
         self.simulation_stopped = False
+        self.update_interval = 2.0  # Seconds between data points
+        
+        # Data points are computed on a worker thread and handed to the Tk thread
+        # through a small queue that drops the oldest point when the UI falls
+        # behind; each poll stores every queued point but refreshes the UI once.
+        # The lock guards the state both sides touch (iteration counter, stop
+        # flag, converged methods and data storage); run_id is bumped on restart
+        # so points computed for a previous run are dropped.
+        self.data_queue = queue.Queue(maxsize=4)
+        self.drain_interval = 33  # Milliseconds between queue polls (~30 FPS ceiling)
+        self.state_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.run_id = 0
         
         # Convergence tracking
         self.convergence_threshold = 0.001  # Energy difference threshold for convergence
         self.convergence_window = 5  # Number of points to check for convergence
         self.converged_methods = set()  # Track which methods have converged
+        self.convergence_ranges = {  # Energy range over the last convergence_window points
+            method: MonoMinMax(self.convergence_window) for method in self.data_storage
+        }
+        
+        # Chart refresh throttle - redraw charts only every Nth iteration
+        self.disp_skip = 3
+        
+        # Axis limits only grow, in these steps, so most updates can blit
+        self.xlim_step = 10  # Iterations
+        self.ylim_step = 0.1  # Hartree
+        self.ylim_growth = 0.2  # Extra span added on the side where data leaves the y limits
+        self.ylim_refit_ratio = 2.0  # Refit once the y limits are this many times the fitted span
+        
+        # Chart renders are spaced at least this far apart; extra requests are coalesced
+        self.min_draw_interval = 0.2  # Seconds
+        self._last_draw_ts = 0.0
+        self._draw_pending = False
+        self._full_draw_needed = False
+        
+        # Full draws rasterize on a worker thread; while one is in flight it owns the figure
+        self.render_executor = ThreadPoolExecutor(max_workers=1)
+        self.render_future = None
+        self.render_dirty = False  # Artist updates deferred while a render was in flight
+        self._figures = []  # Figures are managed here rather than through pyplot
+        
+        # Errors in the periodic callbacks are logged, at most once per interval
+        self.error_log_interval = 5.0  # Seconds
+        self.last_error_log = float('-inf')
+        
+        # Tk widget writes are batched and flushed once per idle cycle
+        self._pending_text = {}
+        self._last_text = {}
+        self._flush_scheduled = False
+        
+        # Last formatted energy per method, so unchanged values are not re-sent
+        self._energy_cache = dict.fromkeys(self.data_storage)
+        
+        # Summary status (text, colour), indexed by the number of converged methods
+        self._STATUS = (
+            ("Running simulations...", self.colors['text']),
+            ("1/3 methods converged", self.colors['accent']),
+            ("2/3 methods converged", self.colors['accent']),
+            ("All methods converged!", self.colors['primary']),
+        )
+        self._last_cc = None  # Converged count the status label currently shows
         
         self.setup_ui()
+        self.root.update_idletasks()
+        self.root.deiconify()
+        
+        # The per-tick update paths rely on these widgets without checking for them
+        for name in ('energy_vars', 'convergence_status_label',
+                     'status_var', 'status_label'):
+            assert hasattr(self, name), f"setup_ui did not create {name}"
         
         # Start real-time data generation
         self.start_data_generation()
@@ -90,7 +304,7 @@ class VQEDashboard:
         title_label = tk.Label(
             navbar,
             text="VQE Quantum Simulator",
-            font=PixelFont.get_clean_font(24, "bold"),
+            font=PixelFont.font(24, "bold"),
             bg=self.colors['bg'],
             fg=self.colors['fg'],
             anchor='center'
@@ -111,7 +325,7 @@ class VQEDashboard:
         sidebar_title = tk.Label(
             sidebar,
             text="Controls",
-            font=PixelFont.get_clean_font(16, "bold"),
+            font=PixelFont.font(16, "bold"),
             bg=self.colors['light_gray'],
             fg=self.colors['text'],
             pady=30
@@ -121,13 +335,46 @@ class VQEDashboard:
         # Clean buttons with better spacing
         btn = self.create_clean_button(sidebar, "Run Simulation")
         btn.pack(fill=tk.X, padx=20, pady=10)
+        
+        # Chart refresh throttle control
+        skip_label = tk.Label(
+            sidebar,
+            text="Redraw charts every N iterations:",
+            font=PixelFont.font(10),
+            bg=self.colors['light_gray'],
+            fg=self.colors['text'],
+            anchor='w'
+        )
+        skip_label.pack(fill=tk.X, padx=20, pady=(30, 5))
+        
+        self.disp_skip_var = tk.StringVar(value=str(self.disp_skip))
+        skip_spinbox = ttk.Spinbox(
+            sidebar,
+            from_=1,
+            to=20,
+            width=5,
+            textvariable=self.disp_skip_var,
+            font=PixelFont.font(10),
+            command=self.on_disp_skip_change
+        )
+        skip_spinbox.pack(anchor='w', padx=20)
+        skip_spinbox.bind("<Return>", lambda e: self.on_disp_skip_change())
+        skip_spinbox.bind("<FocusOut>", lambda e: self.on_disp_skip_change())
+            
+    def on_disp_skip_change(self):
+        """Apply a new chart refresh interval from the sidebar spinbox"""
+        try:
+            self.disp_skip = max(1, int(self.disp_skip_var.get()))
+        except ValueError:
+            pass  # Keep the previous value on invalid input
+        self.disp_skip_var.set(str(self.disp_skip))
             
     def create_clean_button(self, parent, text):
         """Create a clean, modern button"""
         btn = tk.Button(
             parent,
             text=text,
-            font=PixelFont.get_clean_font(11),
+            font=PixelFont.font(11),
             bg=self.colors['primary'],
             fg='white',
             relief=tk.FLAT,
@@ -161,14 +408,17 @@ class VQEDashboard:
             self.update_status("🔬 Starting quantum simulation...")
             print("🔬 Starting quantum simulation...")
             # Reset data and restart
-            self.current_iteration = 0
-            self.converged_methods = set()  # Reset convergence tracking
-            self.simulation_stopped = False  # Reset simulation stop flag
-            for method in self.data_storage:
-                self.data_storage[method]['iterations'] = []
-                self.data_storage[method]['energy'] = []
-            # Reset chart titles
-            self.reset_chart_titles()
+            with self.state_lock:
+                self.run_id += 1
+                self.current_iteration = 0
+                self.converged_methods = set()  # Reset convergence tracking
+                self._held[:] = np.nan
+                self.simulation_stopped = False  # Reset simulation stop flag
+                for method in self.data_storage:
+                    self.clear_history(method)
+            # Clear the charts
+            self._energy_cache = dict.fromkeys(self.data_storage)
+            self.reset_charts()
             
         # Reset status after 2 seconds
         self.root.after(2000, lambda: self.update_status("Ready - Real-time VQE Simulation"))
@@ -183,90 +433,22 @@ class VQEDashboard:
         
     def create_panel_grid(self, parent):
         """Create the 2x2 grid with 3 charts and 1 energy summary box"""
-        # Configure grid weights
-        parent.grid_rowconfigure(0, weight=1)
-        parent.grid_rowconfigure(1, weight=1)
-        parent.grid_columnconfigure(0, weight=1)
-        parent.grid_columnconfigure(1, weight=1)
-        
-        # Panel 1: Normal VQE
-        self.panel1 = self.create_chart_panel(
-            parent, "Normal VQE", 
-            self.create_normal_vqe_chart,
-            "Current Energy: Calculating..."
-        )
-        self.panel1.grid(row=0, column=0, padx=15, pady=15, sticky="nsew")
-        
-        # Panel 2: VQE with UCCSD + Hybrid Optimizer  
-        self.panel2 = self.create_chart_panel(
-            parent, "VQE + UCCSD + Hybrid Optimizer",
-            self.create_vqe_uccsd_hybrid_chart,
-            "Current Energy: Calculating..."
-        )
-        self.panel2.grid(row=0, column=1, padx=15, pady=15, sticky="nsew")
-        
-        # Panel 3: VQE with UCCSD + Hybrid Optimizer + ZNE
-        self.panel3 = self.create_chart_panel(
-            parent, "VQE + UCCSD + Hybrid Optimizer + ZNE",
-            self.create_vqe_uccsd_hybrid_zne_chart,
-            "Current Energy: Calculating..."
-        )
-        self.panel3.grid(row=1, column=0, padx=15, pady=15, sticky="nsew")
-        
-        # Panel 4: Energy Summary Box
+        # Equal halves, so the summary panel lines up with the figure's empty cell
+        parent.grid_rowconfigure(0, weight=1, uniform='half')
+        parent.grid_rowconfigure(1, weight=1, uniform='half')
+        parent.grid_columnconfigure(0, weight=1, uniform='half')
+        parent.grid_columnconfigure(1, weight=1, uniform='half')
+        
+        # Panels 1-3: a single figure holding all three charts, spanning the grid
+        chart_panel = Frame(parent, bg='white', relief=tk.FLAT, borderwidth=1)
+        chart_panel.configure(highlightbackground=self.colors['border'], highlightthickness=1)
+        chart_panel.grid(row=0, column=0, rowspan=2, columnspan=2, padx=15, pady=15, sticky="nsew")
+        self.create_charts(chart_panel)
+        
+        # Panel 4: Energy Summary Box, stacked over the figure's empty bottom-right cell
         self.panel4 = self.create_energy_summary_panel(parent)
         self.panel4.grid(row=1, column=1, padx=15, pady=15, sticky="nsew")
         
-    def create_chart_panel(self, parent, title, chart_function, result_text):
-        """Create a clean panel with title, chart, and result text"""
-        panel = Frame(parent, bg='white', relief=tk.FLAT, borderwidth=1)
-        panel.configure(highlightbackground=self.colors['border'], highlightthickness=1)
-        
-        # Panel title with better styling
-        title_frame = Frame(panel, bg='white', height=50)
-        title_frame.pack(fill=tk.X)
-        title_frame.pack_propagate(False)
-        
-        title_label = tk.Label(
-            title_frame,
-            text=title,
-            font=PixelFont.get_clean_font(14, "bold"),
-            bg='white',
-            fg=self.colors['text'],
-            pady=15
-        )
-        title_label.pack()
-        
-        # Chart area with padding
-        chart_frame = Frame(panel, bg='white')
-        chart_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        # Store chart frame and result label for updates
-        panel.chart_frame = chart_frame
-        
-        # Create the specific chart
-        chart_function(chart_frame)
-        
-        # Result text with better styling
-        result_frame = Frame(panel, bg='white', height=40)
-        result_frame.pack(fill=tk.X)
-        result_frame.pack_propagate(False)
-        
-        result_label = tk.Label(
-            result_frame,
-            text=result_text,
-            font=PixelFont.get_clean_font(10),
-            bg='white',
-            fg=self.colors['primary'],
-            pady=10
-        )
-        result_label.pack()
-        
-        # Store result label for updates
-        panel.result_label = result_label
-        
-        return panel
-        
     def create_energy_summary_panel(self, parent):
         """Create an energy summary panel showing all method energies"""
         panel = Frame(parent, bg='white', relief=tk.FLAT, borderwidth=1)
@@ -280,7 +462,7 @@ class VQEDashboard:
         title_label = tk.Label(
             title_frame,
             text="Energy Values Summary",
-            font=PixelFont.get_clean_font(14, "bold"),
+            font=PixelFont.font(14, "bold"),
             bg='white',
             fg=self.colors['text'],
             pady=15
@@ -291,8 +473,8 @@ class VQEDashboard:
         content_frame = Frame(panel, bg='white')
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        # Create energy display labels
-        self.energy_labels = {}
+        # Create energy display labels, updated through their StringVars
+        self.energy_vars = {}
         methods = [
             ('normal_vqe', 'Normal VQE'),
             ('vqe_uccsd_hybrid', 'VQE + UCCSD + Hybrid'),
@@ -307,7 +489,7 @@ class VQEDashboard:
             name_label = tk.Label(
                 method_frame,
                 text=f"{method_name}:",
-                font=PixelFont.get_clean_font(11, "bold"),
+                font=PixelFont.font(11, "bold"),
                 bg='white',
                 fg=self.colors['text'],
                 anchor='w'
@@ -315,17 +497,18 @@ class VQEDashboard:
             name_label.pack(side=tk.LEFT)
             
             # Energy value label
+            energy_var = tk.StringVar(value="Calculating...")
             energy_label = tk.Label(
                 method_frame,
-                text="Calculating...",
-                font=PixelFont.get_clean_font(11),
+                textvariable=energy_var,
+                font=PixelFont.font(11),
                 bg='white',
                 fg=self.colors['primary'],
                 anchor='e'
             )
             energy_label.pack(side=tk.RIGHT)
             
-            self.energy_labels[method_key] = energy_label
+            self.energy_vars[method_key] = energy_var
             
         # Add convergence status
         status_frame = Frame(content_frame, bg='white')
@@ -334,7 +517,7 @@ class VQEDashboard:
         status_title = tk.Label(
             status_frame,
             text="Convergence Status:",
-            font=PixelFont.get_clean_font(11, "bold"),
+            font=PixelFont.font(11, "bold"),
             bg='white',
             fg=self.colors['text']
         )
@@ -343,7 +526,7 @@ class VQEDashboard:
         self.convergence_status_label = tk.Label(
             status_frame,
             text="Running simulations...",
-            font=PixelFont.get_clean_font(10),
+            font=PixelFont.font(10),
             bg='white',
             fg=self.colors['accent'],
             wraplength=200,
@@ -353,122 +536,170 @@ class VQEDashboard:
         
         return panel
         
-    def create_normal_vqe_chart(self, parent):
-        """Create normal VQE energy vs iterations chart"""
-        try:
-            fig, ax = plt.subplots(figsize=(5, 3.2), facecolor='white')
-            ax.set_facecolor('white')
-            
-            # Initial empty plot
-            line, = ax.plot([], [], color=self.colors['primary'], linewidth=2.5, alpha=0.8, label='Normal VQE')
-            scatter = ax.scatter([], [], color=self.colors['accent'], s=30, alpha=0.7, zorder=5)
-            
-            ax.set_xlabel('Iterations', color=self.colors['text'], fontsize=10)
-            ax.set_ylabel('Energy (Hartree)', color=self.colors['text'], fontsize=10)
-            ax.grid(True, alpha=0.3, color='gray', linestyle='-', linewidth=0.5)
-            ax.tick_params(colors=self.colors['text'], labelsize=9)
-            ax.legend(fontsize=8, loc='upper right')
-            
-            # Clean styling
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(self.colors['border'])
-            ax.spines['bottom'].set_color(self.colors['border'])
-            
-            # Set initial limits
-            ax.set_xlim(0, 50)
-            ax.set_ylim(-2.0, 0.0)  # Expanded initial range to accommodate lower values
-            
-            plt.tight_layout(pad=1.0)
-            
-            # Store figure and axes for updates
-            parent.fig = fig
-            parent.ax = ax
-            parent.line = line
-            parent.scatter = scatter
-            
-            # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            parent.canvas = canvas
-            
-        except Exception as e:
-            self.create_error_placeholder(parent, f"Chart Error: {e}")
-            
-    def create_vqe_uccsd_hybrid_chart(self, parent):
-        """Create VQE with UCCSD + Hybrid Optimizer chart"""
+    def create_charts(self, parent):
+        """Create one figure with the three method charts on a shared canvas"""
+        self.charts = {}
         try:
-            fig, ax = plt.subplots(figsize=(5, 3.2), facecolor='white')
-            ax.set_facecolor('white')
-            
-            line, = ax.plot([], [], color='darkorange', linewidth=2.5, alpha=0.8, label='VQE + UCCSD + Hybrid')
-            scatter = ax.scatter([], [], color=self.colors['accent'], s=30, alpha=0.7, zorder=5)
-            
-            ax.set_xlabel('Iterations', color=self.colors['text'], fontsize=10)
-            ax.set_ylabel('Energy (Hartree)', color=self.colors['text'], fontsize=10)
-            ax.grid(True, alpha=0.3, color='gray', linestyle='-', linewidth=0.5)
-            ax.tick_params(colors=self.colors['text'], labelsize=9)
-            ax.legend(fontsize=8, loc='upper right')
+            fig = Figure(figsize=(10, 6.4), facecolor='white')
+            self._figures.append(fig)
+            grid = fig.add_gridspec(2, 2)
             
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(self.colors['border'])
-            ax.spines['bottom'].set_color(self.colors['border'])
+            # Bottom-right cell is left empty for the energy summary panel
+            self.charts['normal_vqe'] = self.create_chart(
+                fig, grid[0, 0], "Normal VQE",
+                self.colors['primary'], 'Normal VQE'
+            )
+            self.charts['vqe_uccsd_hybrid'] = self.create_chart(
+                fig, grid[0, 1], "VQE + UCCSD + Hybrid Optimizer",
+                'darkorange', 'VQE + UCCSD + Hybrid'
+            )
+            self.charts['vqe_uccsd_hybrid_zne'] = self.create_chart(
+                fig, grid[1, 0], "VQE + UCCSD + Hybrid Optimizer + ZNE",
+                'darkred', 'VQE + UCCSD + Hybrid + ZNE'
+            )
             
-            ax.set_xlim(0, 50)
-            ax.set_ylim(-2.0, 0.0)  # Expanded initial range to accommodate lower values
+            fig.tight_layout(pad=1.0)
             
-            plt.tight_layout(pad=1.0)
+            # Render with Agg and show the RGBA buffer as a photo image on a Tk canvas
+            canvas = FigureCanvasAgg(fig)
+            chart_widget = Canvas(parent, bg='white', highlightthickness=0)
+            chart_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
             
-            parent.fig = fig
-            parent.ax = ax
-            parent.line = line
-            parent.scatter = scatter
+            # Store figure, canvas and photo image for updates
+            self.fig = fig
+            self.chart_canvas = canvas
+            self.chart_widget = chart_widget
+            self.chart_photo = None  # Created at the rendered size by show_charts
+            self.chart_image_id = chart_widget.create_image(0, 0, anchor='nw')
+            self.chart_draw_pending = False
+            self.chart_size = None  # Pending (width, height) in pixels, applied before the next draw
             
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            parent.canvas = canvas
+            # Line, scatter and texts of every chart are redrawn by blitting
+            self.blit_manager = BlitManager(canvas, [
+                artist
+                for chart in self.charts.values()
+                for artist in (chart.line, chart.scatter, chart.result_text, chart.status_text)
+            ])
+            chart_widget.bind("<Configure>", self.on_chart_resize)
+            self.draw_charts()
             
         except Exception as e:
+            self.charts = {}
             self.create_error_placeholder(parent, f"Chart Error: {e}")
             
-    def create_vqe_uccsd_hybrid_zne_chart(self, parent):
-        """Create VQE with UCCSD + Hybrid Optimizer + ZNE chart"""
-        try:
-            fig, ax = plt.subplots(figsize=(5, 3.2), facecolor='white')
-            ax.set_facecolor('white')
-            
-            line, = ax.plot([], [], color='darkred', linewidth=2.5, alpha=0.8, label='VQE + UCCSD + Hybrid + ZNE')
-            scatter = ax.scatter([], [], color=self.colors['accent'], s=30, alpha=0.7, zorder=5)
-            
-            ax.set_xlabel('Iterations', color=self.colors['text'], fontsize=10)
-            ax.set_ylabel('Energy (Hartree)', color=self.colors['text'], fontsize=10)
-            ax.grid(True, alpha=0.3, color='gray', linestyle='-', linewidth=0.5)
-            ax.tick_params(colors=self.colors['text'], labelsize=9)
-            ax.legend(fontsize=8, loc='upper right')
+    def create_chart(self, fig, cell, title, color, label):
+        """Create an energy vs iterations chart in one cell of the figure"""
+        ax = fig.add_subplot(cell)
+        ax.set_title(title)
+        
+        # Initial empty plot - the data artists are animated and drawn by blitting
+        line, = ax.plot([], [], color=color, linewidth=2.5, alpha=0.8, label=label, animated=True)
+        scatter = ax.scatter([], [], color=self.colors['accent'], s=30, alpha=0.7, zorder=5, animated=True)
+        result_text = ax.text(
+            0.02, 0.04, "Current Energy: Calculating...",
+            transform=ax.transAxes,
+            color=self.colors['primary'],
+            fontsize=9,
+            bbox=dict(facecolor='white', edgecolor='none', alpha=0.8),
+            animated=True
+        )
+        status_text = ax.text(
+            0.98, 0.04, "",
+            transform=ax.transAxes,
+            ha='right',
+            color='green',
+            fontsize=9,
+            fontweight='bold',
+            animated=True
+        )
+        
+        ax.set_xlabel('Iterations')
+        ax.set_ylabel('Energy (Hartree)')
+        ax.legend()
+        
+        # Set initial limits
+        ax.set_xlim(0, 50)
+        ax.set_ylim(-2.0, 0.0)  # Expanded initial range to accommodate lower values
+        
+        scatter_offsets = np.empty(((self.history_size + 4) // 5, 2))
+        return ChartPanel(title, ax, line, scatter, result_text, status_text, scatter_offsets)
+        
+    def on_chart_resize(self, event):
+        """Resize the figure to fill the Tk canvas"""
+        if event.width > 1 and event.height > 1:
+            self.chart_size = (event.width, event.height)
+            self.draw_charts_idle()
             
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(self.colors['border'])
-            ax.spines['bottom'].set_color(self.colors['border'])
+    def draw_charts_idle(self):
+        """Schedule a single full chart redraw for when Tk is idle"""
+        if not self.chart_draw_pending:
+            self.chart_draw_pending = True
+            self.root.after_idle(self.draw_charts)
             
-            ax.set_xlim(0, 50)
-            ax.set_ylim(-2.0, 0.0)  # Expanded initial range to accommodate lower values
+    def draw_charts(self):
+        """Fully redraw the figure on the render thread"""
+        if self.render_future is not None:
+            return  # chart_draw_pending stays set - redrawn when the current render finishes
+        self.chart_draw_pending = False
+        if self.chart_size is not None:
+            width, height = self.chart_size
+            self.fig.set_size_inches(width / self.fig.dpi, height / self.fig.dpi)
+            self.chart_size = None
+        self.render_future = self.render_executor.submit(self.render_charts)
+        self.root.after(10, self.poll_render)
+        
+    def render_charts(self):
+        """Rasterize the figure (render thread) and return a copy of its RGBA buffer"""
+        self.chart_canvas.draw()  # The blit manager re-captures the background
+        return np.array(self.chart_canvas.buffer_rgba())
+        
+    def poll_render(self):
+        """Show a finished render and catch up on anything deferred meanwhile"""
+        if not self.render_future.done():
+            self.root.after(10, self.poll_render)
+            return
+        future, self.render_future = self.render_future, None
+        try:
+            self.show_charts(future.result())
             
-            # Tighter layout with padding
-            plt.tight_layout(pad=1.0)
+            if self.chart_draw_pending:
+                self.draw_charts()
+            elif self.render_dirty:
+                self.render_dirty = False
+                self.update_result_labels({m: t for m, t in self._energy_cache.items() if t is not None})
+                self.update_charts()
+        except Exception:
+            self.log_error("Error rendering charts")
             
-            parent.fig = fig
-            parent.ax = ax
-            parent.line = line
-            parent.scatter = scatter
+    def close_charts(self):
+        """Release the chart figures and destroy the canvas widget showing them"""
+        self.render_executor.shutdown(wait=False)  # Drop any queued chart render
+        self.wait_for_render()  # ...but let one already in flight finish with the figure
+        for fig in self._figures:
+            fig.clear()
+        self._figures.clear()
+        if hasattr(self, 'chart_widget'):
+            self.chart_widget.destroy()
             
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            parent.canvas = canvas
+    def wait_for_render(self):
+        """Block until an in-flight render has released the figure (shutdown only)"""
+        if self.render_future is not None:
+            self.render_future.exception()  # Waits without raising - poll_render reports failures
             
-        except Exception as e:
-            self.create_error_placeholder(parent, f"Chart Error: {e}")
+    def show_charts(self, buffer=None):
+        """Copy an RGBA buffer (by default the Agg canvas's own) into the Tk photo image"""
+        if buffer is None:
+            buffer = np.asarray(self.chart_canvas.buffer_rgba())
+        height, width = buffer.shape[:2]
+        if self.chart_photo is None or (self.chart_photo.width(), self.chart_photo.height()) != (width, height):
+            self.chart_photo = ImageTk.PhotoImage('RGBA', (width, height))
+            self.chart_widget.itemconfigure(self.chart_image_id, image=self.chart_photo)
+        self.chart_photo.paste(Image.frombuffer('RGBA', (width, height), buffer, 'raw', 'RGBA', 0, 1))
+        
+    def blit_charts(self):
+        """Redraw only the animated artists on top of the cached background"""
+        self.blit_manager.update()
+        self.show_charts()
             
     def create_error_placeholder(self, parent, error_msg):
         """Create an error placeholder when charts fail to load"""
@@ -478,274 +709,397 @@ class VQEDashboard:
         error_label = tk.Label(
             error_frame,
             text=f"⚠ {error_msg}",
-            font=PixelFont.get_clean_font(10),
+            font=PixelFont.font(10),
             bg='white',
             fg=self.colors['accent'],
             wraplength=200
         )
         error_label.pack(expand=True)
         
-    def start_data_generation(self):
-        """Start the real-time data generation with 2-second intervals"""
-        # Check if simulation should stop
-        if self.simulation_stopped or len(self.converged_methods) >= 3:
-            if len(self.converged_methods) >= 3:
-                self.update_status("✅ Simulation completed - All methods converged!")
-                self.simulation_stopped = True
-            return
-            
-        self.generate_new_data_point()
-        # Schedule next update in 2 seconds (2000 milliseconds) only if not stopped
-        if not self.simulation_stopped:
-            self.root.after(2000, self.start_data_generation)
-        
-    def generate_new_data_point(self):
-        """Generate new random data points for all VQE methods"""
-        iteration = self.current_iteration
-        
-        # Generate random data for each method with different characteristics
-        # Normal VQE - slower convergence, more noise
-        if 'normal_vqe' not in self.converged_methods:
-            normal_energy = -0.8 - 0.4 * (1 - np.exp(-iteration/20)) + 0.08 * np.random.random()
-        else:
-            # Keep at ground state with minimal fluctuation
-            normal_energy = self.data_storage['normal_vqe']['energy'][-1] + 0.001 * (np.random.random() - 0.5)
-        
-        # VQE + UCCSD + Hybrid - fast convergence, medium noise
-        if 'vqe_uccsd_hybrid' not in self.converged_methods:
-            hybrid_energy = -1.0 - 0.4 * (1 - np.exp(-iteration/10)) + 0.03 * np.random.random()
-        else:
-            hybrid_energy = self.data_storage['vqe_uccsd_hybrid']['energy'][-1] + 0.001 * (np.random.random() - 0.5)
+    def create_history(self):
+        """Create an empty preallocated history buffer for one method"""
+        # Buffers are double length and every point is written twice, so the
+        # latest history_size points are always one contiguous slice
+        return {
+            'iterations': np.empty(2 * self.history_size, dtype=np.float64),
+            'energy': np.empty(2 * self.history_size, dtype=np.float64),
+            'count': 0,
+            'head': 0,
+            'y_min': np.inf,  # Running energy extremes over the stored points
+            'y_max': -np.inf
+        }
         
-        # VQE + UCCSD + Hybrid + ZNE - best performance with all optimizations
-        if 'vqe_uccsd_hybrid_zne' not in self.converged_methods:
-            zne_energy = -1.1 - 0.5 * (1 - np.exp(-iteration/8)) + 0.02 * np.random.random()
+    def clear_history(self, method_name):
+        """Empty a method's ring buffer and running statistics"""
+        data = self.data_storage[method_name]
+        data['count'] = 0
+        data['head'] = 0
+        data['y_min'] = np.inf
+        data['y_max'] = -np.inf
+        self.convergence_ranges[method_name].clear()
+        
+    def append_data_point(self, method_name, iteration, energy):
+        """Write a new point into a method's ring buffer"""
+        data = self.data_storage[method_name]
+        head = data['head']
+        
+        # Once the buffer is full the point at head is overwritten
+        evicted = data['energy'][head] if data['count'] == self.history_size else None
+        
+        data['iterations'][head] = data['iterations'][head + self.history_size] = iteration
+        data['energy'][head] = data['energy'][head + self.history_size] = energy
+        data['head'] = (head + 1) % self.history_size
+        data['count'] = min(data['count'] + 1, self.history_size)
+        self.convergence_ranges[method_name].append(energy)
+        
+        # Keep the running min/max; rescan only if an extreme just left the window
+        if evicted is not None and (evicted == data['y_min'] or evicted == data['y_max']):
+            energies = self.get_history(method_name)[1]
+            data['y_min'] = energies.min()
+            data['y_max'] = energies.max()
         else:
-            zne_energy = self.data_storage['vqe_uccsd_hybrid_zne']['energy'][-1] + 0.0005 * (np.random.random() - 0.5)
-        
-        # Store new data points
-        self.data_storage['normal_vqe']['iterations'].append(iteration)
-        self.data_storage['normal_vqe']['energy'].append(normal_energy)
+            data['y_min'] = min(data['y_min'], energy)
+            data['y_max'] = max(data['y_max'], energy)
         
-        self.data_storage['vqe_uccsd_hybrid']['iterations'].append(iteration)
-        self.data_storage['vqe_uccsd_hybrid']['energy'].append(hybrid_energy)
+    def get_history(self, method_name):
+        """Return (iterations, energies) views in chronological order"""
+        data = self.data_storage[method_name]
+        count = data['count']
+        start = (data['head'] - count) % self.history_size
+        return data['iterations'][start:start + count], data['energy'][start:start + count]
         
-        self.data_storage['vqe_uccsd_hybrid_zne']['iterations'].append(iteration)
-        self.data_storage['vqe_uccsd_hybrid_zne']['energy'].append(zne_energy)
+    def start_data_generation(self):
+        """Start the worker thread producing data every 2 seconds and poll its queue"""
+        self.data_thread = threading.Thread(target=self.produce_data_points, daemon=True)
+        self.data_thread.start()
+        self.drain_data_queue()
+        
+    def produce_data_points(self):
+        """Worker thread loop: compute a new data point every update_interval seconds"""
+        while not self.stop_event.is_set():
+            with self.state_lock:
+                if not self.simulation_stopped:
+                    run_id = self.run_id
+                    iteration = self.current_iteration
+                    energies = self.compute_energies(iteration)
+                    self.current_iteration += 1
+                    self.enqueue_data_point((run_id, iteration, energies))
+            self.stop_event.wait(self.update_interval)
+            
+    def compute_energies(self, iteration):
+        """Generate new random energies for all VQE methods (caller holds state_lock)"""
+        # Take this iteration's noise from the pre-drawn batch, refilling it in place when used up
+        if self._noise_idx == len(self._noise_buf):
+            self.rng.random(out=self._noise_buf)
+            self._noise_idx = 0
+        noise = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        
+        # Generate random data for all methods at once, each with different characteristics
+        decay = self._exp_table[min(iteration, len(self._exp_table) - 1)]
+        energies = self._base - self._amp * (1 - decay) + self._noise * noise
+        
+        # Keep converged methods at ground state with minimal fluctuation
+        converged = ~np.isnan(self._held)
+        return np.where(converged, self._held + self._held_noise * (noise - 0.5), energies)
+        
+    def enqueue_data_point(self, item):
+        """Queue a data point for the Tk thread, dropping the oldest one if the queue is full"""
+        try:
+            self.data_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self.data_queue.get_nowait()
+            except queue.Empty:
+                pass  # The Tk thread drained it meanwhile
+            self.data_queue.put_nowait(item)
+            
+    def drain_data_queue(self):
+        """Store all queued data points, refresh the UI once with the latest, then poll again"""
+        latest = None
+        redraw_charts = False
+        try:
+            # Only take what is already queued so a fast producer can't starve Tk. The
+            # producer may also drop the oldest point meanwhile, so stop once it is empty.
+            for _ in range(self.data_queue.maxsize):
+                try:
+                    run_id, iteration, energies = self.data_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if run_id == self.run_id:
+                    try:
+                        redraw_charts |= self.apply_data_point(iteration, energies)
+                        latest = (iteration, energies)
+                    except Exception:
+                        self.log_error("Error applying data point %d", iteration)
+                        
+            if latest is not None:
+                try:
+                    self.update_display(*latest, redraw_charts)
+                except Exception:
+                    self.log_error("Error updating display for iteration %d", latest[0])
+        finally:
+            self.root.after(self.drain_interval, self.drain_data_queue)
+        
+    def log_error(self, message, *args):
+        """Log the current exception, rate-limited so a failing tick can't flood the log"""
+        now = time.monotonic()
+        if now - self.last_error_log >= self.error_log_interval:
+            self.last_error_log = now
+            logger.warning(message, *args, exc_info=True)
+        
+    def apply_data_point(self, iteration, energies):
+        """Store a new data point for all VQE methods, returning True if the charts are due a redraw"""
+        normal_energy, hybrid_energy, zne_energy = energies
+        
+        with self.state_lock:
+            # Store new data points
+            self.append_data_point('normal_vqe', iteration, normal_energy)
+            self.append_data_point('vqe_uccsd_hybrid', iteration, hybrid_energy)
+            self.append_data_point('vqe_uccsd_hybrid_zne', iteration, zne_energy)
+            
+            # Check for convergence
+            previously_converged = len(self.converged_methods)
+            self.check_convergence(iteration)
+            converged_count = len(self.converged_methods)
+            newly_converged = converged_count > previously_converged
+            
+            # Stop producing data once every method has converged
+            if converged_count == 3:
+                self.simulation_stopped = True
+                
+        # Update charts every disp_skip iterations (always on convergence)
+        return iteration % self.disp_skip == 0 or newly_converged
         
-        # Check for convergence
-        self.check_convergence()
+    def update_display(self, iteration, energies, redraw_charts):
+        """Show the latest data point in the labels, charts and status bar"""
+        converged_count = len(self.converged_methods)
         
-        # Update charts
-        self.update_charts()
+        # Update the chart energy text and the energy summary, formatting each value once
+        energy_texts = self.format_energies(energies)
+        self.update_result_labels(energy_texts)
+        self.update_energy_summary(energy_texts)
         
-        # Update result labels and energy summary
-        self.update_result_labels(normal_energy, hybrid_energy, zne_energy)
-        self.update_energy_summary(normal_energy, hybrid_energy, zne_energy)
+        if redraw_charts:
+            self.update_charts(iteration)
+        elif energy_texts and self.charts:
+            self.request_draw()  # Blit the new chart energy text every tick, like the summary
         
         # Update status
-        converged_count = len(self.converged_methods)
         if converged_count == 3:
             self.update_status(f"✅ Iteration {iteration}: All methods converged - Simulation complete!")
-            self.simulation_stopped = True
         elif converged_count > 0:
             self.update_status(f"Iteration {iteration}: {converged_count}/3 methods converged")
         else:
             self.update_status(f"Iteration {iteration}: Generating new quantum data...")
-        
-        # Increment iteration counter
-        self.current_iteration += 1
-        
-        # Keep only last 50 points for performance
-        if len(self.data_storage['normal_vqe']['iterations']) > 50:
-            for method in self.data_storage:
-                self.data_storage[method]['iterations'] = self.data_storage[method]['iterations'][-50:]
-                self.data_storage[method]['energy'] = self.data_storage[method]['energy'][-50:]
     
-    def check_convergence(self):
+    def check_convergence(self, iteration):
         """Check if any methods have converged based on energy difference threshold"""
-        for method_name, data in self.data_storage.items():
+        for index, method_name in enumerate(self.data_storage):
             if method_name in self.converged_methods:
                 continue  # Already converged
                 
-            energies = data['energy']
-            if len(energies) >= self.convergence_window:
-                # Check if the last few energy values are within threshold
-                recent_energies = energies[-self.convergence_window:]
-                energy_range = max(recent_energies) - min(recent_energies)
+            # Check if the last few energy values are within threshold
+            recent_range = self.convergence_ranges[method_name]
+            if recent_range.is_full() and recent_range.range() < self.convergence_threshold:
+                self.converged_methods.add(method_name)
+                self._held[index] = self.get_history(method_name)[1][-1]
+                print(f"{method_name} has converged to ground state at iteration {iteration}")
                 
-                if energy_range < self.convergence_threshold:
-                    self.converged_methods.add(method_name)
-                    print(f"{method_name} has converged to ground state at iteration {self.current_iteration}")
-                    
-                    # Update the chart title to show convergence
-                    self.mark_convergence(method_name)
+                # Update the chart title to show convergence
+                self.mark_convergence(method_name)
     
     def mark_convergence(self, method_name):
         """Mark a method as converged in the UI"""
-        try:
-            if method_name == 'normal_vqe' and hasattr(self.panel1.chart_frame, 'ax'):
-                title = self.panel1.chart_frame.ax.get_title()
-                self.panel1.chart_frame.ax.set_title("Normal VQE - CONVERGED ✓", 
-                                                   color='green', fontweight='bold', fontsize=10)
-                self.panel1.chart_frame.canvas.draw()
-                
-            elif method_name == 'vqe_uccsd' and hasattr(self.panel2.chart_frame, 'ax'):
-                self.panel2.chart_frame.ax.set_title("VQE + UCCSD - CONVERGED ✓", 
-                                                   color='green', fontweight='bold', fontsize=10)
-                self.panel2.chart_frame.canvas.draw()
-                
-            elif method_name == 'vqe_uccsd_hybrid' and hasattr(self.panel3.chart_frame, 'ax'):
-                self.panel3.chart_frame.ax.set_title("VQE + UCCSD + Hybrid - CONVERGED ✓", 
-                                                   color='green', fontweight='bold', fontsize=10)
-                self.panel3.chart_frame.canvas.draw()
-                
-            elif method_name == 'vqe_uccsd_hybrid_zne' and hasattr(self.panel4.chart_frame, 'ax'):
-                self.panel4.chart_frame.ax.set_title("VQE + UCCSD + Hybrid + ZNE - CONVERGED ✓", 
-                                                   color='green', fontweight='bold', fontsize=10)
-                self.panel4.chart_frame.canvas.draw()
-                
-        except Exception as e:
-            print(f"Error marking convergence for {method_name}: {e}")
+        chart = self.charts.get(method_name)
+        if chart is not None:
+            # Applied by the chart update a convergence always triggers (after any render)
+            chart.pending_status = "CONVERGED ✓"
             
-    def reset_chart_titles(self):
-        """Reset chart titles when simulation restarts"""
+    def reset_charts(self):
+        """Clear the charts and convergence marks when simulation restarts"""
         try:
-            if hasattr(self.panel1.chart_frame, 'ax'):
-                self.panel1.chart_frame.ax.set_title("", fontsize=10)
-                self.panel1.chart_frame.canvas.draw()
-                
-            if hasattr(self.panel2.chart_frame, 'ax'):
-                self.panel2.chart_frame.ax.set_title("", fontsize=10)
-                self.panel2.chart_frame.canvas.draw()
+            # Applied by update_charts, which defers while a render owns the figure
+            for chart in self.charts.values():
+                chart.reset_pending = True
+                chart.pending_status = ""
                 
-            if hasattr(self.panel3.chart_frame, 'ax'):
-                self.panel3.chart_frame.ax.set_title("", fontsize=10)
-                self.panel3.chart_frame.canvas.draw()
+            if self.charts:
+                self.update_charts()
+                self.draw_charts_idle()
                 
-            if hasattr(self.panel4.chart_frame, 'ax'):
-                self.panel4.chart_frame.ax.set_title("", fontsize=10)
-                self.panel4.chart_frame.canvas.draw()
-                
-        except Exception as e:
-            print(f"Error resetting chart titles: {e}")
+        except Exception:
+            self.log_error("Error resetting charts")
     
-    def update_charts(self):
-        """Update all charts with new data"""
-        try:
-            # Update Normal VQE chart (Panel 1)
-            if hasattr(self.panel1.chart_frame, 'line'):
-                iterations = self.data_storage['normal_vqe']['iterations']
-                energies = self.data_storage['normal_vqe']['energy']
-                
-                self.panel1.chart_frame.line.set_data(iterations, energies)
-                if len(iterations) > 0:
-                    # Update scatter plot with every 5th point
-                    scatter_iterations = iterations[::5] if len(iterations) >= 5 else iterations
-                    scatter_energies = energies[::5] if len(energies) >= 5 else energies
-                    self.panel1.chart_frame.scatter.set_offsets(list(zip(scatter_iterations, scatter_energies)))
-                
-                # Auto-scale both x and y axes
-                if iterations:
-                    self.panel1.chart_frame.ax.set_xlim(0, max(max(iterations) + 5, 50))
-                if energies:
-                    min_energy = min(energies)
-                    max_energy = max(energies)
-                    energy_range = max_energy - min_energy
-                    margin = max(0.1, energy_range * 0.1)  # 10% margin or minimum 0.1
-                    self.panel1.chart_frame.ax.set_ylim(min_energy - margin, max_energy + margin)
+    def update_charts(self, iteration=None):
+        """Update all charts with new data (iteration=None refreshes every chart)"""
+        if self.render_future is not None:
+            self.render_dirty = True  # The figure is being rendered - refresh when it is done
+            return
+        
+        charts_updated = False
+        limits_changed = False
+        for method_name, chart in self.charts.items():
+            if chart.reset_pending:
+                chart.reset_pending = False
+                if self._energy_cache[method_name] is None:  # No value from the new run yet
+                    chart.result_text.set_text("Current Energy: Calculating...")
+                chart.frozen = False
+                # Let the axes shrink back to the new data
+                chart.ax.set_xlim(0, 50)
+                chart.ylim = None
+                limits_changed = True
+            if chart.pending_status is not None:
+                chart.status_text.set_text(chart.pending_status)
+                chart.pending_status = None
+                charts_updated = True
                 
-                self.panel1.chart_frame.canvas.draw()
+            # Converged charts barely move - only refresh them every 10 iterations
+            if chart.frozen and iteration is not None and iteration - chart.refreshed_at < 10:
+                continue
+            chart.frozen = method_name in self.converged_methods
+            if iteration is not None:
+                chart.refreshed_at = iteration
+            charts_updated = True
             
-            # Update VQE + UCCSD + Hybrid chart (Panel 2)
-            if hasattr(self.panel2.chart_frame, 'line'):
-                iterations = self.data_storage['vqe_uccsd_hybrid']['iterations']
-                energies = self.data_storage['vqe_uccsd_hybrid']['energy']
-                
-                self.panel2.chart_frame.line.set_data(iterations, energies)
-                if len(iterations) > 0:
-                    scatter_iterations = iterations[::5] if len(iterations) >= 5 else iterations
-                    scatter_energies = energies[::5] if len(energies) >= 5 else energies
-                    self.panel2.chart_frame.scatter.set_offsets(list(zip(scatter_iterations, scatter_energies)))
-                
-                # Auto-scale both x and y axes
-                if iterations:
-                    self.panel2.chart_frame.ax.set_xlim(0, max(max(iterations) + 5, 50))
-                if energies:
-                    min_energy = min(energies)
-                    max_energy = max(energies)
-                    energy_range = max_energy - min_energy
-                    margin = max(0.1, energy_range * 0.1)  # 10% margin or minimum 0.1
-                    self.panel2.chart_frame.ax.set_ylim(min_energy - margin, max_energy + margin)
-                
-                self.panel2.chart_frame.canvas.draw()
+            # float64 views into the preallocated ring buffers - no list conversion
+            iterations, energies = self.get_history(method_name)
             
-            # Update VQE + UCCSD + Hybrid + ZNE chart (Panel 3)
-            if hasattr(self.panel3.chart_frame, 'line'):
-                iterations = self.data_storage['vqe_uccsd_hybrid_zne']['iterations']
-                energies = self.data_storage['vqe_uccsd_hybrid_zne']['energy']
-                
-                self.panel3.chart_frame.line.set_data(iterations, energies)
-                if len(iterations) > 0:
-                    scatter_iterations = iterations[::5] if len(iterations) >= 5 else iterations
-                    scatter_energies = energies[::5] if len(energies) >= 5 else energies
-                    self.panel3.chart_frame.scatter.set_offsets(list(zip(scatter_iterations, scatter_energies)))
-                
-                # Auto-scale both x and y axes
-                if iterations:
-                    self.panel3.chart_frame.ax.set_xlim(0, max(max(iterations) + 5, 50))
-                if energies:
-                    min_energy = min(energies)
-                    max_energy = max(energies)
-                    energy_range = max_energy - min_energy
-                    margin = max(0.1, energy_range * 0.1)  # 10% margin or minimum 0.1
-                    self.panel3.chart_frame.ax.set_ylim(min_energy - margin, max_energy + margin)
-                
-                self.panel3.chart_frame.canvas.draw()
-                
-        except Exception as e:
-            print(f"Error updating charts: {e}")
-    
-    def update_result_labels(self, normal_energy, hybrid_energy, zne_energy):
-        """Update the result labels with current energy values"""
-        try:
-            if hasattr(self.panel1, 'result_label'):
-                self.panel1.result_label.config(text=f"Current Energy: {normal_energy:.4f} Hartree")
+            chart.line.set_xdata(iterations)
+            chart.line.set_ydata(energies)
             
-            if hasattr(self.panel2, 'result_label'):
-                self.panel2.result_label.config(text=f"Current Energy: {hybrid_energy:.4f} Hartree")
+            # Update scatter plot with every 5th point, filled into the preallocated buffer
+            offsets = chart.scatter_offsets[:(len(iterations) + 4) // 5]
+            offsets[:, 0] = iterations[::5]
+            offsets[:, 1] = energies[::5]
+            chart.scatter.set_offsets(offsets)
             
-            if hasattr(self.panel3, 'result_label'):
-                self.panel3.result_label.config(text=f"Current Energy: {zne_energy:.4f} Hartree")
-                
-        except Exception as e:
-            print(f"Error updating result labels: {e}")
-    
-    def update_energy_summary(self, normal_energy, hybrid_energy, zne_energy):
-        """Update the energy summary panel with current values"""
+            # Auto-scale both x and y axes
+            if len(iterations) > 0:
+                data = self.data_storage[method_name]
+                if self.update_axis_limits(chart, iterations[-1], data['y_min'], data['y_max']):
+                    limits_changed = True
+        
+        # One render for all three charts, throttled to min_draw_interval
+        if limits_changed:
+            self._full_draw_needed = True
+        if charts_updated:
+            self.request_draw()
+            
+    def request_draw(self):
+        """Render the charts now, or once the minimum inter-frame interval has passed"""
+        if self._draw_pending:
+            return  # Already scheduled - it will pick up the latest artist state
+        remaining = self.min_draw_interval - (time.monotonic() - self._last_draw_ts)
+        if remaining > 0:
+            self._draw_pending = True
+            self.root.after(int(remaining * 1000) + 1, self._do_draw)
+        else:
+            self._do_draw()
+            
+    def _do_draw(self):
+        """Full draw if any axis moved, otherwise blit"""
+        self._draw_pending = False
+        if self.render_future is not None:
+            self.render_dirty = True
+            return
+        self._last_draw_ts = time.monotonic()
         try:
-            if hasattr(self, 'energy_labels'):
-                self.energy_labels['normal_vqe'].config(text=f"{normal_energy:.4f} Hartree")
-                self.energy_labels['vqe_uccsd_hybrid'].config(text=f"{hybrid_energy:.4f} Hartree")  
-                self.energy_labels['vqe_uccsd_hybrid_zne'].config(text=f"{zne_energy:.4f} Hartree")
-                
-            # Update convergence status
-            if hasattr(self, 'convergence_status_label'):
-                converged_count = len(self.converged_methods)
-                if converged_count == 3:
-                    status_text = "All methods converged!"
-                    color = self.colors['primary']
-                elif converged_count > 0:
-                    status_text = f"{converged_count}/3 methods converged"
-                    color = self.colors['accent']
-                else:
-                    status_text = "Running simulations..."
-                    color = self.colors['text']
+            if self._full_draw_needed:
+                self._full_draw_needed = False
+                # An idle draw lets Tk coalesce this with a resize into a single render
+                self.draw_charts_idle()
+            else:
+                self.blit_charts()
+        except Exception:
+            self.log_error("Error drawing charts")
+    
+    def update_axis_limits(self, chart, last_iteration, min_energy, max_energy):
+        """Grow a chart's axis limits to fit its data, returning True if they changed"""
+        changed = False
+        
+        # Only extend the x axis once the data reaches the current limit
+        x_max = max(last_iteration + 5, 50)
+        if x_max > chart.ax.get_xlim()[1]:
+            chart.ax.set_xlim(0, np.ceil(x_max / self.xlim_step) * self.xlim_step)
+            changed = True
+            
+        # Fit to the data (10% margin or minimum 0.1), rounded outwards to a coarse grid
+        margin = max(0.1, (max_energy - min_energy) * 0.1)
+        fit_min = np.floor((min_energy - margin) / self.ylim_step) * self.ylim_step
+        fit_max = np.ceil((max_energy + margin) / self.ylim_step) * self.ylim_step
+        
+        if chart.ylim is None:
+            y_min, y_max = fit_min, fit_max
+        else:
+            y_min, y_max = chart.ylim
+            if y_max - y_min > self.ylim_refit_ratio * (fit_max - fit_min):
+                # The data now fills only a small part of the axis (e.g. a converged plateau)
+                y_min, y_max = fit_min, fit_max
+            else:
+                # Grow only the side the data left, by a generous step to amortize rescales
+                growth = (y_max - y_min) * self.ylim_growth
+                if min_energy < y_min:
+                    y_min = np.floor((min_energy - growth) / self.ylim_step) * self.ylim_step
+                if max_energy > y_max:
+                    y_max = np.ceil((max_energy + growth) / self.ylim_step) * self.ylim_step
                     
-                self.convergence_status_label.config(text=status_text, fg=color)
-                
-        except Exception as e:
-            print(f"Error updating energy summary: {e}")
+        if (y_min, y_max) != chart.ylim:
+            chart.ylim = (y_min, y_max)
+            chart.ax.set_ylim(y_min, y_max)
+            changed = True
+            
+        return changed
+        
+    def format_energies(self, energies):
+        """Format each method's energy, returning only the strings that changed"""
+        energy_texts = {}
+        for method_name, energy in zip(self.data_storage, energies):
+            text = f"{energy:.4f} Hartree"
+            if text != self._energy_cache[method_name]:
+                self._energy_cache[method_name] = energy_texts[method_name] = text
+        return energy_texts
+        
+    def update_result_labels(self, energy_texts):
+        """Update the per-chart energy text with changed energy strings"""
+        if self.render_future is not None:
+            self.render_dirty = True  # Re-applied from _energy_cache after the render
+            return
+        for method_name, text in energy_texts.items():
+            if method_name in self.charts:
+                self.charts[method_name].result_text.set_text(f"Current Energy: {text}")
+    
+    def update_energy_summary(self, energy_texts):
+        """Update the energy summary panel with changed values"""
+        for method_name, text in energy_texts.items():
+            self._queue_text(self.energy_vars[method_name], text)
+            
+        # Update convergence status only when the converged count changes
+        converged_count = len(self.converged_methods)
+        if converged_count != self._last_cc:
+            # Rare transition - text and colour in one configure call
+            status_text, color = self._STATUS[converged_count]
+            self.convergence_status_label.config(text=status_text, fg=color)
+            self._last_cc = converged_count
+            
+    def _queue_text(self, var, text):
+        """Queue a StringVar value for the next idle flush"""
+        key = id(var)
+        if self._last_text.get(key) == text:
+            self._pending_text.pop(key, None)  # Back to what is already shown
+            return
+        self._pending_text[key] = (var, text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_text)
+            
+    def _flush_text(self):
+        """Apply all queued StringVar writes in one batch"""
+        self._flush_scheduled = False
+        pending, self._pending_text = self._pending_text, {}
+        for key, (var, text) in pending.items():
+            var.set(text)
+            self._last_text[key] = text
         
     def create_footer(self):
         """Create the footer with prototype disclaimer"""
@@ -756,7 +1110,7 @@ class VQEDashboard:
         footer_text = tk.Label(
             footer,
             text="Real-time VQE Simulation - Data updates every 2 seconds",
-            font=PixelFont.get_clean_font(10),
+            font=PixelFont.font(10),
             bg=self.colors['bg'],
             fg=self.colors['text'],
             anchor='center'
@@ -775,7 +1129,7 @@ class VQEDashboard:
         self.status_label = tk.Label(
             status_frame,
             textvariable=self.status_var,
-            font=PixelFont.get_clean_font(9),
+            font=PixelFont.font(9),
             bg=self.colors['secondary'],
             fg=self.colors['text'],
             anchor='w'
@@ -784,9 +1138,11 @@ class VQEDashboard:
         
     def update_status(self, message):
         """Update the status bar message"""
-        if hasattr(self, 'status_var'):
-            self.status_var.set(message)
-            self.root.update_idletasks()
+        self.status_var.set(message)  # Repainted on the next idle cycle
+            
+    def flush_status(self):
+        """Paint a pending status message now, e.g. right before a blocking call"""
+        self.status_label.update_idletasks()
 
 def main():
     """Run the VQE Dashboard application"""
@@ -800,11 +1156,13 @@ def main():
         # Handle window closing gracefully
         def on_closing():
             try:
-                plt.close('all')  # Close all matplotlib figures
-                root.quit()
-                root.destroy()
-            except:
-                pass
+                dashboard.stop_event.set()  # Stop the data worker thread
+                dashboard.close_charts()  # Release the figures and their canvas
+            finally:
+                try:
+                    root.destroy()  # Also ends mainloop
+                except tk.TclError:
+                    pass  # Window already destroyed
             
         root.protocol("WM_DELETE_WINDOW", on_closing)
         